@@ -1,11 +1,11 @@
 """Module with album parsing logic."""
 
 import re
-from dataclasses import dataclass
-from functools import cached_property
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
-from .helpers import PATTERNS, Helpers
+from .helpers import PATTERNS, Helpers, has_ft_marker
 
 JSONDict = Dict[str, Any]
 
@@ -16,11 +16,13 @@ class AlbumName:
     SERIES = re.compile(rf"{_series}[ ]?[A-Z\d.-]+\b")
     SERIES_FMT = re.compile(rf"^(.+){_series} *0*")
     REMIX_IN_TITLE = re.compile(r"[\( :]+(with re|inc|\+).*mix(\)|(.*$))", re.I)
-    CLEAN_EPLP = re.compile(r"(?:[([]|Double ){0,2}(\b[EL]P\b)\S?", re.I)
+    CLEAN_EP = re.compile(r"(?:[([]|Double ){0,2}\bEP\b\S?", re.I)
+    CLEAN_LP = re.compile(r"(?:[([]|Double ){0,2}\bLP\b\S?", re.I)
     EPLP_ALBUM = re.compile(
         r"\b((?:(?!VA|Various|-)[^: ]+ )+)([EL]P(?! *\d)(?: [\w#][^ ]+$)?)"
     )
     QUOTED_ALBUM = re.compile(r"(['\"])([^'\"]+)\1( VA\d+)*( |$)")
+    EPLP_IN_DESC = re.compile(r"((?!The|This)\b[A-Z][^ \n]+\b )+[EL]P\b")
     ALBUM_IN_DESC = re.compile(r"(?:Title: ?|Album(?::|/Single) )([^\n]+)")
     CLEAN_VA_EXCLUDE = re.compile(r"\w various artists \w", re.I)
     CLEAN_VA = re.compile(
@@ -31,64 +33,74 @@ class AlbumName:
         re.IGNORECASE + re.VERBOSE,
     )
     COMPILATION_IN_TITLE = re.compile(r"compilation|best of|anniversary", re.I)
+    IN_BRACKETS = re.compile(r"^\[(.*)\]$")
 
     original: str
     description: str
     from_track_titles: Optional[str]
 
     remove_artists = True
+    from_description: Optional[str] = field(init=False)
+    from_title: Optional[str] = field(init=False)
+    mentions_compilation: bool = field(init=False)
+    album_names: List[str] = field(init=False)
+    name: str = field(init=False)
+    series_part: Optional[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Parse everything that 'get' needs upfront, since it is always called."""
+        self.from_description = self._get_from_description()
+        self.from_title = self._get_from_title()
+        self.mentions_compilation = bool(
+            self.COMPILATION_IN_TITLE.search(self.original)
+        )
+        priority_list = [
+            self.from_track_titles,
+            self.from_description,
+            self.from_title,
+            self.original,
+        ]
+        self.album_names = list(filter(None, priority_list))
+        self.name = self.album_names[0] if self.album_names else self.original
+        self.series_part = self._get_series_part()
 
-    @cached_property
-    def from_description(self) -> Optional[str]:
+    def _get_from_description(self) -> Optional[str]:
         """Try finding album name in the release description."""
-        if m := self.ALBUM_IN_DESC.search(self.description):
+        description = self.description
+        if ("Title:" in description or "Album" in description) and (
+            m := self.ALBUM_IN_DESC.search(description)
+        ):
             self.remove_artists = False
             return m.group(1).strip()
 
         return None
 
-    @cached_property
-    def mentions_compilation(self) -> bool:
-        return bool(self.COMPILATION_IN_TITLE.search(self.original))
-
-    @cached_property
-    def from_title(self) -> Optional[str]:
+    def _get_from_title(self) -> Optional[str]:
         """Try to guess album name from the original title.
 
         Return the first match from below, defaulting to None:
         1. If 'EP' or 'LP' is in the original name, album name is what precedes it.
         2. If quotes are used in the title, they probably contain the album name.
         """
-        if m := self.EPLP_ALBUM.search(self.original):
+        original = self.original
+        if ("EP" in original or "LP" in original) and (
+            m := self.EPLP_ALBUM.search(original)
+        ):
             return " ".join(i.strip(" '") for i in m.groups())
 
-        if m := self.QUOTED_ALBUM.search(self.original):
+        if m := self.QUOTED_ALBUM.search(original):
             return m.expand(r"\2\3")
 
         return None
 
-    @cached_property
-    def album_names(self) -> List[str]:
-        priority_list = [
-            self.from_track_titles,
-            self.from_description,
-            self.from_title,
-            self.original,
-        ]
-        return list(filter(None, priority_list))
-
-    @cached_property
-    def name(self) -> str:
-        return next(iter(self.album_names))
-
-    @cached_property
-    def series_part(self) -> Optional[str]:
-        """Return series if it is found in any of the album names."""
-        for name in self.album_names:
-            if m := self.SERIES.search(name):
-                return m.group()
+    def _get_series_part(self) -> Optional[str]:
+        """Return series if it is found in any of the album names.
 
-        return None
+        Names are searched in one go: the unit separator is not a word character,
+        therefore a match cannot span two names.
+        """
+        m = self.SERIES.search("\x1f".join(self.album_names))
+        return m.group() if m else None
 
     @staticmethod
     def format_series(m: re.Match) -> str:  # type: ignore[type-arg]
@@ -105,6 +117,16 @@ class AlbumName:
         suffix = "." if len(series) in {2, 3} else ""
         return f"{album}{series}{suffix} "
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_series_patterns(series: str) -> Tuple[Pattern[str], Pattern[str]]:
+        """Return patterns that find the series at the start and within the album."""
+        series = re.escape(series)
+        return (
+            re.compile(rf"^({series})\W+(.+)"),
+            re.compile(rf"(?<=\w)( {series}(?!\)))"),
+        )
+
     def standardize_series(self, album: str) -> str:
         """Standardize 'Vol', 'Part' etc. format."""
         series = self.series_part
@@ -118,20 +140,20 @@ class AlbumName:
 
             album += series
         else:
+            series_at_start, series_in_middle = self.get_series_patterns(series)
             # move from the beginning to the end of the album
-            album, moved = re.subn(rf"^({series})\W+(.+)", r"\2, \1", album)
+            album, moved = series_at_start.subn(r"\2, \1", album)
             if not moved:
                 # otherwise, ensure that it is delimited by a comma
-                album = re.sub(rf"(?<=\w)( {series}(?!\)))", r",\1", album)
+                album = series_in_middle.sub(r",\1", album)
 
         return self.SERIES_FMT.sub(self.format_series, album)
 
     @staticmethod
-    def remove_label(name: str, label: str) -> str:
-        if not label:
-            return name
-
-        pattern = re.compile(
+    @lru_cache(maxsize=256)
+    def get_label_pattern(label: str) -> Pattern[str]:
+        """Return a pattern that removes the label, which is expected in lowercase."""
+        return re.compile(
             rf"""
             \W*               # pick up any punctuation
             (?<!\w[ ])        # cannot be preceded by a simple word
@@ -141,48 +163,99 @@ class AlbumName:
         """,
             flags=re.VERBOSE | re.IGNORECASE,
         )
-        return pattern.sub(" ", name).strip()
+
+    @classmethod
+    def remove_label(cls, name: str, label: str) -> str:
+        label = label.lower()
+        if not label or label not in name.lower():
+            return name
+
+        return cls.get_label_pattern(label).sub(" ", name).strip()
 
     @classmethod
     def remove_va(cls, name: str) -> str:
-        if not cls.CLEAN_VA_EXCLUDE.search(name):
-            return cls.CLEAN_VA.sub(" ", name)
+        lower_name = name.lower()
+        if "various artist" in lower_name:
+            if cls.CLEAN_VA_EXCLUDE.search(name):
+                return name
+        elif not lower_name.startswith(("va", "v/a")):
+            # neither of the CLEAN_VA alternatives can match
+            return name
 
+        return cls.CLEAN_VA.sub(" ", name)
+
+    @classmethod
+    def remove_ft(cls, name: str) -> str:
+        if not has_ft_marker(name):
+            return name
+
+        return PATTERNS["ft"].sub("", name)
+
+    @classmethod
+    def remove_remix(cls, name: str) -> str:
+        if "mix" not in name.lower():
+            return name
+
+        return cls.REMIX_IN_TITLE.sub(" ", name)
+
+    @classmethod
+    def format_eplp(cls, name: str) -> str:
+        """Uppercase EP and LP, and remove surrounding parens / brackets."""
+        lower_name = name.lower()
+        if "ep" in lower_name:
+            name = cls.CLEAN_EP.sub("EP", name)
+        if "lp" in lower_name:
+            name = cls.CLEAN_LP.sub("LP", name)
         return name
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_clean_patterns(
+        word: str,
+    ) -> Tuple[Pattern[str], Pattern[str], Pattern[str]]:
+        """Return patterns used to remove the given artist or catalognum.
+
+        1. The word preceded by 'by', 'vs' or 'split w', removed along with it
+        2. The word being part of the album name, in which case it is kept
+        3. The word itself, with any surrounding punctuation
+        """
+        w = re.escape(word)
+        return (
+            re.compile(rf" *(?i:(compiled )?by|vs|\W*split w) {w}"),
+            re.compile(rf"\w {w} \w|(of|&) {w}|{w}(['_\d]| (deluxe|[el]p\b|&))", re.I),
+            re.compile(
+                rf"""
+    (?<! x )
+    (^|[^\])\w])+
+    (?i:{w})
+    ([^(\[\w]| _|(\d+$))*
+                """,
+                re.VERBOSE,
+            ),
+        )
+
     @classmethod
     def clean(cls, name: str, to_clean: List[str], label: str = "") -> str:
         """Return clean album name.
 
         Catalogue number and artists to be removed are provided as 'to_clean'.
         """
-        name = re.sub(r"^\[(.*)\]$", r"\1", name)
+        name = cls.IN_BRACKETS.sub(r"\1", name)
 
-        for w in map(re.escape, filter(None, to_clean)):
-            name = re.sub(rf" *(?i:(compiled )?by|vs|\W*split w) {w}", "", name)
-            if not re.search(
-                rf"\w {w} \w|(of|&) {w}|{w}(['_\d]| (deluxe|[el]p\b|&))", name, re.I
-            ):
-                name = re.sub(
-                    rf"""
-    (?<! x )
-    (^|[^\])\w])+
-    (?i:{w})
-    ([^(\[\w]| _|(\d+$))*
-                    """,
-                    " ",
-                    name,
-                    flags=re.VERBOSE,
-                ).strip()
-
-        name = PATTERNS["ft"].sub("", name)
-        name = cls.remove_va(name)
-        name = cls.remove_label(Helpers.clean_name(name), label)
-        name = cls.REMIX_IN_TITLE.sub(" ", name).strip("- ")
+        for w in to_clean:
+            # skip words that are not found in the name to avoid running their patterns
+            if not w or w.lower() not in name.lower():
+                continue
 
-        # uppercase EP and LP, and remove surrounding parens / brackets
-        name = cls.CLEAN_EPLP.sub(lambda x: x.group(1).upper(), name)
-        return name.strip(" /")
+            by_word, part_of_name, word = cls.get_clean_patterns(w)
+            name = by_word.sub("", name)
+            if not part_of_name.search(name):
+                name = word.sub(" ", name).strip()
+
+        name = cls.remove_va(cls.remove_ft(name))
+        name = cls.remove_label(Helpers.clean_name(name), label)
+        name = cls.format_eplp(cls.remove_remix(name))
+        return name.strip(" -/")
 
     def check_eplp(self, album: str) -> str:
         """Return album name followed by 'EP' or 'LP' if that's given in the comments.
@@ -190,13 +263,23 @@ class AlbumName:
         When album is given, search for the album.
         Otherwise, search for (Capital-case Album Name) (EP or LP) and return the match.
         """
-        if album:
-            look_for = re.escape(f"{album} ")
-        else:
-            look_for = r"((?!The|This)\b[A-Z][^ \n]+\b )+"
+        description = self.description
+        if not album:
+            m = self.EPLP_IN_DESC.search(description)
+            return m.group() if m else album
+
+        # same as searching for rf"{album} [EL]P\b", without compiling a pattern
+        idx = description.find(album)
+        while idx >= 0:
+            end = idx + len(album) + 3
+            next_char = description[end : end + 1]
+            if description[end - 3 : end] in {" EP", " LP"} and not (
+                next_char.isalnum() or next_char == "_"
+            ):
+                return description[idx:end]
+            idx = description.find(album, idx + 1)
 
-        m = re.search(rf"{look_for}[EL]P\b", self.description)
-        return m.group() if m else album
+        return album
 
     def get(
         self,
@@ -209,7 +292,8 @@ class AlbumName:
         to_clean = [catalognum]
         if self.remove_artists:
             to_clean.extend(original_artists + artists)
-        to_clean = sorted(filter(None, set(to_clean)), key=len, reverse=True)
+        to_clean = list({w for w in to_clean if w})
+        to_clean.sort(key=len, reverse=True)
 
         album = self.clean(original_album, to_clean, label)
         if album.startswith("("):
@@ -1,6 +1,6 @@
 """List of MusicBrainz genres from https://beta.musicbrainz.org/genres"""
 
-GENRES = {
+GENRES = frozenset({
     "2 tone",
     "2-step",
     "acid house",
@@ -800,4 +800,4 @@ GENRES = {
     "zeuhl",
     "zouk",
     "zydeco",
-}
+})
@@ -1,10 +1,22 @@
 """Module with a Helpers class that contains various static, independent functions."""
 
 import re
-from functools import lru_cache, partial
-from itertools import chain, starmap
-from operator import contains
-from typing import Any, Dict, Iterable, List, NamedTuple, Pattern
+from functools import lru_cache
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    NamedTuple,
+    Pattern,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from beets.autotag.hooks import AlbumInfo
 from ordered_set import OrderedSet as ordset
@@ -12,6 +24,7 @@ from ordered_set import OrderedSet as ordset
 from .genres_lookup import GENRES
 
 JSONDict = Dict[str, Any]
+T = TypeVar("T")
 DIGI_MEDIA = "Digital Media"
 FORMAT_TO_MEDIA = {
     "VinylFormat": "Vinyl",
@@ -66,6 +79,12 @@ CATNUM_PAT = {
     "anywhere": re.compile(rf"({_cat_pat}(\ [/-]\ {_cat_pat})?)", re.VERBOSE),
 }
 
+HAS_DIGIT = re.compile(r"\d")
+# remove full stops and hashes and ensure the expected form of 'and'
+GENRE_TRANSLATION = str.maketrans({".": None, "#": None, "&": "and"})
+KEYWORD_DELIMITER = re.compile(r"[.] | #| - ")
+GENRE_WORD_DELIMITER = re.compile("[ -]")
+
 PATTERNS: Dict[str, Pattern[str]] = {
     "split_artists": re.compile(r", - |, | (?:[x+/-]|//|vs|and)[.]? "),
     "meta": re.compile(r'.*"@id".*'),
@@ -89,8 +108,18 @@ PATTERNS: Dict[str, Pattern[str]] = {
     "track_alt": re.compile(
         r"^([A-J]{1,3}[12]?\.?\d|[AB]+(?=\W{2,}))(?:(?!-\w)[^\w(]|_)+", re.I + re.M
     ),
-    "vinyl_name": re.compile(r"[1-5](?= ?(xLP|LP|x))|single|double|triple", re.I),
+    "vinyl_name": re.compile(r"[1-5](?= ?(?:xLP|LP|x))|single|double|triple", re.I),
 }
+# lowercase substrings that must be present for PATTERNS["ft"] to match
+FT_MARKERS = ("ft", "feat", "with", "w/")
+
+
+def has_ft_marker(value: str) -> bool:
+    """Return whether PATTERNS["ft"] may match the given value."""
+    lower_value = value.lower()
+    return any(marker in lower_value for marker in FT_MARKERS)
+
+
 rm_strings = [
     "limited edition",
     r"^[EL]P( \d+)?",
@@ -123,24 +152,60 @@ def split_artist_title(m: re.Match) -> str:
     return f"{artist} - {title}"
 
 
+# each pattern is only applied if the name contains the accompanying substring
 # fmt: off
 CLEAN_PATTERNS = [
-    (re.compile(rf"(([\[(])|(^| ))\*?({'|'.join(rm_strings)})(?(2)[])]|([- ]|$))", re.I), ""),       # noqa
-    (re.compile(r" -(\S)"), r" - \1"),                    # hi -bye          -> hi - bye
-    (re.compile(r"(\S)- "), r"\1 - "),                    # hi- bye          -> hi - bye
-    (re.compile(r"  +"), " "),                            # hi  bye          -> hi bye
-    (re.compile(r"(- )?\( *"), "("),                      # hi - ( bye)      -> hi (bye)
-    (re.compile(r" \)+|(\)+$)"), ")"),                    # hi (bye ))       -> hi (bye)
-    (re.compile(r"- Reworked"), "(Reworked)"),            # bye - Reworked   -> bye (Reworked)    # noqa
-    (re.compile(rf"(\({REMIX.pattern})$", re.I), r"\1)"),    # bye - (Some Mix  -> bye - (Some Mix)  # noqa
-    (re.compile(rf"- *({REMIX.pattern})$", re.I), r"(\1)"),  # bye - Some Mix   -> bye (Some Mix)    # noqa
-    (re.compile(r'(^|- )[“"]([^”"]+)[”"]( \(|$)'), r"\1\2\3"),   # "bye" -> bye; hi - "bye" -> hi - bye  # noqa
-    (re.compile(r"\((the )?(remixes)\)", re.I), r"\2"),   # Album (Remixes)  -> Album Remixes     # noqa
-    (re.compile(r"examine-.+CD\d+_([^_-]+)[_-](.*)"), split_artist_title),  # See https://examine-archive.bandcamp.com/album/va-examine-archive-international-sampler-xmn01 # noqa
+    (re.compile(rf"(([\[(])|(^| ))\*?({'|'.join(rm_strings)})(?(2)[])]|([- ]|$))", re.I), "", ""),  # noqa
+    (re.compile(r" -(\S)"), r" - \1", " -"),              # hi -bye          -> hi - bye
+    (re.compile(r"(\S)- "), r"\1 - ", "- "),              # hi- bye          -> hi - bye
+    (re.compile(r"  +"), " ", "  "),                      # hi  bye          -> hi bye
+    (re.compile(r"(- )?\( *"), "(", "("),                 # hi - ( bye)      -> hi (bye)
+    (re.compile(r" \)+|(\)+$)"), ")", ")"),               # hi (bye ))       -> hi (bye)
+    (re.compile(r"- Reworked"), "(Reworked)", "- Reworked"),  # bye - Reworked   -> bye (Reworked)    # noqa
+    (re.compile(rf"(\({REMIX.pattern})$", re.I), r"\1)", "("),    # bye - (Some Mix  -> bye - (Some Mix)  # noqa
+    (re.compile(rf"- *({REMIX.pattern})$", re.I), r"(\1)", "-"),  # bye - Some Mix   -> bye (Some Mix)    # noqa
+    (re.compile(r'(^|- )[“"]([^”"]+)[”"]( \(|$)'), r"\1\2\3", ""),   # "bye" -> bye; hi - "bye" -> hi - bye  # noqa
+    (re.compile(r"\((the )?(remixes)\)", re.I), r"\2", "("),   # Album (Remixes)  -> Album Remixes     # noqa
+    (re.compile(r"examine-.+CD\d+_([^_-]+)[_-](.*)"), split_artist_title, "examine-"),  # See https://examine-archive.bandcamp.com/album/va-examine-archive-international-sampler-xmn01 # noqa
 ]
 # fmt: on
 
 
+class cached_property(Generic[T]):
+    """A lock-free version of `functools.cached_property`.
+
+    Before Python 3.12, `functools.cached_property` acquires a lock on every first
+    access. Parsing is single-threaded, so we store the value in the instance
+    `__dict__` directly, which then takes precedence over this descriptor.
+    """
+
+    name: str
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Any = None) -> "cached_property[T]":
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: Any = None) -> T:
+        ...
+
+    def __get__(
+        self, instance: object, owner: Any = None
+    ) -> Union[T, "cached_property[T]"]:
+        if instance is None:
+            return self
+
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
+
+
 class Helpers:
     @staticmethod
     def get_label(meta: JSONDict) -> str:
@@ -153,19 +218,30 @@ class Helpers:
     @staticmethod
     def get_vinyl_count(name: str) -> int:
         conv = {"single": 1, "double": 2, "triple": 3}
-        for m in PATTERNS["vinyl_name"].finditer(name):
-            count = m.group()
-            return int(count) if count.isdigit() else conv[count.lower()]
-        return 1
+        m = PATTERNS["vinyl_name"].search(name)
+        if not m:
+            return 1
+
+        count = m.group()
+        return int(count) if count.isdigit() else conv[count.lower()]
 
     @staticmethod
     def split_artists(artists: Iterable[str]) -> List[str]:
         """Split artists taking into account delimiters such as ',', '+', 'x', 'X' etc.
         Note: featuring artists are removed since they are not main artists.
         """
-        no_ft_artists = (PATTERNS["ft"].sub("", a) for a in artists)
-        split = map(PATTERNS["split_artists"].split, ordset(no_ft_artists))
-        split_artists = ordset(map(str.strip, chain(*split))) - {"", "more"}
+        return list(Helpers._split_artists(tuple(artists)))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _split_artists(artists: Tuple[str, ...]) -> Tuple[str, ...]:
+        no_ft_artists = dict.fromkeys(
+            (PATTERNS["ft"].sub("", a) if has_ft_marker(a) else a) for a in artists
+        )
+        split = map(PATTERNS["split_artists"].split, no_ft_artists)
+        split_artists = dict.fromkeys(map(str.strip, chain.from_iterable(split)))
+        for invalid in ("", "more"):
+            split_artists.pop(invalid, None)
 
         for artist in list(split_artists):
             # ' & ' or ' X ' may be part of single artist name, so we need to be careful
@@ -173,28 +249,45 @@ class Helpers:
             # only split then
             for char in "X&":
                 subartists = artist.split(f" {char} ")
-                if len(subartists) > 1 and any(s in split_artists for s in subartists):
-                    split_artists.discard(artist)  # type: ignore[attr-defined]
-                    split_artists.update(subartists)  # type: ignore[attr-defined]
-        return list(split_artists)
+                if len(subartists) == 1 or split_artists.keys().isdisjoint(subartists):
+                    continue
+
+                split_artists.pop(artist, None)
+                split_artists.update(dict.fromkeys(subartists))
+        return tuple(split_artists)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_label_catnum_pattern(label: str) -> Pattern[str]:
+        """Return a pattern for a catalogue number that starts with the label name.
+
+        The label is matched case-insensitively, so pass it lowercase to share the
+        pattern between its spellings.
+        """
+        return re.compile(LABEL_CATNUM.format(re.escape(label)), re.VERBOSE)
 
     @staticmethod
-    @lru_cache(maxsize=None)
+    @lru_cache(maxsize=256)
     def parse_catalognum(
         album="", disctitle="", description="", label="", artistitles=""
     ):
         # type: (str, str, str, str, str) -> str
         """Try getting the catalog number looking at text from various fields."""
-        cases = [
-            (CATNUM_PAT["header"], description),
+        numbered_cases = [
             (CATNUM_PAT["anywhere"], disctitle),
             (CATNUM_PAT["anywhere"], album),
             (CATNUM_PAT["start_end"], description),
             (CATNUM_PAT["anywhere"], description),
         ]
-        if label:
-            pat = re.compile(LABEL_CATNUM.format(re.escape(label)), re.VERBOSE)
-            cases.append((pat, "\n".join((album, disctitle, description))))
+        label_text = "\n".join((album, disctitle, description))
+        # the label catalognum starts with the label, so it must be found in the text
+        if label and label.lower() in label_text.lower():
+            pat = Helpers.get_label_catnum_pattern(label.lower())
+            numbered_cases.append((pat, label_text))
+
+        # apart from the header, the patterns only match text that has a digit
+        cases = [(CATNUM_PAT["header"], description)]
+        cases.extend((p, s) for p, s in numbered_cases if HAS_DIGIT.search(s))
 
         def find(pat: Pattern[str], string: str) -> str:
             """Return the match.
@@ -213,18 +306,35 @@ class Helpers:
                     return catnum
             return ""
 
-        try:
-            return next(filter(None, starmap(find, cases)))
-        except StopIteration:
-            return ""
+        for pat, string in cases:
+            if string and (catnum := find(pat, string)):
+                return catnum
+        return ""
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def clean_name(name: str) -> str:
-        """Both album and track names are cleaned using these patterns."""
-        for pat, repl in CLEAN_PATTERNS:
-            name = pat.sub(repl, name).strip()
+        """Both album and track names are cleaned using these patterns.
+
+        Track artists repeat within a release, so the results are cached.
+        """
+        for pat, repl, required in CLEAN_PATTERNS:
+            if required in name:
+                name = pat.sub(repl, name).strip()
         return name
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def get_always_include_patterns(
+        patterns: Tuple[str, ...],
+    ) -> Tuple[Pattern[str], ...]:
+        """Return the compiled 'always_include' patterns.
+
+        They are compiled separately, since a user pattern may use global flags
+        or backreferences that would break if joined with others.
+        """
+        return tuple(map(re.compile, patterns))
+
     @staticmethod
     def get_genre(
         keywords: Iterable[str], config: JSONDict, label: str
@@ -250,33 +360,39 @@ class Helpers:
 
              "garage house" is preferred over "house".
         """
-        valid_mb_genre = partial(contains, GENRES)
+        valid_mb_genre = GENRES.__contains__
         label_name = label.lower().replace(" ", "")
 
         def is_label_name(kw: str) -> bool:
             return kw.replace(" ", "") == label_name and not valid_mb_genre(kw)
 
+        always_include = tuple(config["always_include"])
+
         def is_included(kw: str) -> bool:
-            return any(re.search(x, kw) for x in config["always_include"])
+            patterns = Helpers.get_always_include_patterns(always_include)
+            return any(p.search(kw) for p in patterns)
 
         def valid_for_mode(kw: str) -> bool:
             if config["mode"] == "classical":
                 return valid_mb_genre(kw)
 
-            words = map(str.strip, re.split("[ -]", kw))
+            words = map(str.strip, GENRE_WORD_DELIMITER.split(kw))
             if config["mode"] == "progressive":
                 return valid_mb_genre(kw) or all(map(valid_mb_genre, words))
 
             return valid_mb_genre(kw) or valid_mb_genre(list(words)[-1])
 
-        unique_genres: ordset[str] = ordset()
+        # a dict keeps the genres unique and in the order they were found
+        unique_genres: Dict[str, None] = {}
         # expand badly delimited keywords
-        split_kw = partial(re.split, r"[.] | #| - ")
-        for kw in chain.from_iterable(map(split_kw, keywords)):
-            # remove full stops and hashes and ensure the expected form of 'and'
-            _kw = re.sub("[.#]", "", str(kw)).replace("&", "and")
+        for kw in chain.from_iterable(map(KEYWORD_DELIMITER.split, keywords)):
+            _kw = str(kw).translate(GENRE_TRANSLATION)
             if not is_label_name(_kw) and (is_included(_kw) or valid_for_mode(_kw)):
-                unique_genres.add(_kw)
+                unique_genres[_kw] = None
+
+        compact = {g: g.replace(" ", "").replace("-", "") for g in unique_genres}
+        # each genre followed by its compact form
+        all_genres = "\0".join(chain.from_iterable(compact.items()))
 
         def within_another_genre(genre: str) -> bool:
             """Check if this genre is part of another genre.
@@ -286,18 +402,21 @@ class Helpers:
 
             This is so that 'dark folk' is kept while 'darkfolk' is removed, and not
             the other way around.
+
+            The genre is found once in itself, and once more in its compact form if
+            it has no spaces or dashes - any other occurrence is in another genre.
             """
-            others = unique_genres - {genre}
-            others |= {x.replace(" ", "").replace("-", "") for x in others}
-            return any(genre in x for x in others)
+            own_count = 2 if compact[genre] == genre else 1
+            return all_genres.count(genre) > own_count
 
         return (g for g in unique_genres if not within_another_genre(g))
 
     @staticmethod
     def unpack_props(obj: JSONDict) -> JSONDict:
         """Add all 'additionalProperty'-ies to the parent dictionary."""
-        for prop in obj.get("additionalProperty") or []:
-            obj[prop["name"]] = prop["value"]
+        props = obj.get("additionalProperty")
+        if props:
+            obj.update((prop["name"], prop["value"]) for prop in props)
         return obj
 
     @staticmethod
@@ -326,14 +445,16 @@ class Helpers:
         """
 
         def valid_format(obj: JSONDict) -> bool:
+            item_type = obj.get("item_type")
             return (
-                {"name", "item_type"} < set(obj)
+                item_type is not None
+                and "name" in obj
                 # not a discography
-                and obj["item_type"] != "b"
+                and item_type != "b"
                 # musicReleaseFormat format is given or it is a USB
-                and ("musicReleaseFormat" in obj or obj["type_id"] == 5)
+                and ("musicReleaseFormat" in obj or obj.get("type_id") == 5)
                 # it is not a vinyl bundle
-                and not (obj["item_type"] == "p" and "bundle" in obj["name"].lower())
+                and not (item_type == "p" and "bundle" in obj["name"].lower())
             )
 
         formats = []
@@ -341,9 +462,9 @@ class Helpers:
             formats.append(
                 MediaInfo(
                     _format["@id"],
-                    FORMAT_TO_MEDIA[
-                        _format.get("musicReleaseFormat") or "DigitalFormat"
-                    ],
+                    FORMAT_TO_MEDIA.get(
+                        _format.get("musicReleaseFormat", ""), DIGI_MEDIA
+                    ),
                     _format["name"],
                     _format.get("description") or "",
                 )
@@ -358,7 +479,7 @@ class Helpers:
         @lru_cache(maxsize=None)
         def get_medium_total(medium: int) -> int:
             starts = {1: "AB", 2: "CD", 3: "EF", 4: "GH", 5: "IJ"}[medium]
-            return len(re.findall(rf"^[{starts}]", "\n".join(track_alts), re.M))
+            return sum(1 for track_alt in track_alts if track_alt[0] in starts)
 
         medium = 1
         medium_index = 1
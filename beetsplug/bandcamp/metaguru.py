@@ -6,7 +6,7 @@ import operator as op
 import re
 from collections import Counter
 from datetime import date, datetime
-from functools import cached_property, partial
+from functools import partial
 from typing import Any, Dict, Iterable, List, Optional, Set
 from unicodedata import normalize
 
@@ -17,7 +17,7 @@ from packaging import version
 from pycountry import countries, subdivisions
 
 from .album import AlbumName
-from .helpers import PATTERNS, Helpers, MediaInfo
+from .helpers import PATTERNS, Helpers, MediaInfo, cached_property
 from .track import Track
 from .tracks import Tracks
 
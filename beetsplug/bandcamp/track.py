@@ -2,28 +2,35 @@
 
 import re
 from dataclasses import dataclass, field
-from functools import cached_property
 from typing import Dict, List, Optional, Tuple
 
-from .helpers import CATNUM_PAT, PATTERNS, REMIX, Helpers, JSONDict
+from .helpers import (
+    CATNUM_PAT,
+    PATTERNS,
+    REMIX,
+    Helpers,
+    JSONDict,
+    cached_property,
+    has_ft_marker,
+)
 
 digiwords = r"""
     # must contain at least one of
-    ([ -]?  # delimiter
-        (bandcamp|digi(tal)?|exclusive|bonus|bns|unreleased)
+    (?:[ -]?  # delimiter
+        (?:bandcamp|digi(?:tal)?|exclusive|bonus|bns|unreleased)
     )+
     # and may be followed by
-    (\W(track|only|tune))*
+    (?:\W(?:track|only|tune))*
     """
 DIGI_ONLY_PATTERN = re.compile(
     rf"""
-(\s|[^][()\w])*  # space or anything that is not a parens or an alphabetical char
-(
-      (^{digiwords}[.:\d\s]+\s)     # begins with 'Bonus.', 'Bonus 1.' or 'Bonus :'
+[^][()\w]*  # space or anything that is not a parens or an alphabetical char
+(?:
+      ^{digiwords}[.:\d\s]+\s       # begins with 'Bonus.', 'Bonus 1.' or 'Bonus :'
  | [\[(]{digiwords}[\])]\W*         # delimited by brackets, '[Bonus]', '(Bonus) -'
  |   [*]{digiwords}[*]?             # delimited by asterisks, '*Bonus', '*Bonus*'
  |      {digiwords}[ ]-             # followed by ' -', 'Bonus -'
- |  ([ ]{digiwords}$)               # might not be delimited if at the end, '... Bonus'
+ |    [ ]{digiwords}$               # might not be delimited if at the end, '... Bonus'
 )
 \s*  # all succeeding space
     """,
@@ -53,6 +60,10 @@ class Remix:
 
 @dataclass
 class Track:
+    INDEX_PREFIX = re.compile(r"^0*(\d+)(?!\W\d)\W+")
+    DIGITS = re.compile(r"\d+")
+    TITLE_DELIMITER = re.compile(r" - (?![^\[(]+[])])")
+
     json_item: JSONDict = field(default_factory=dict)
     track_id: str = ""
     index: Optional[int] = None
@@ -73,15 +84,17 @@ class Track:
 
         Return the clean name, and whether this track is digi-only.
         """
-        clean_name = DIGI_ONLY_PATTERN.sub("", name)
-        return clean_name, clean_name != name
+        clean_name, count = DIGI_ONLY_PATTERN.subn("", name)
+        return clean_name, bool(count)
 
     @staticmethod
     def split_ft(value: str) -> Tuple[str, str, str]:
         """Return ft artist, full ft string, and the value without the ft string."""
+        if not has_ft_marker(value):
+            return "", "", value
+
         if m := PATTERNS["ft"].search(value):
-            grp = m.groupdict()
-            return grp["ft_artist"], grp["ft"], value.replace(m.group(), "")
+            return m["ft_artist"], m["ft"], value.replace(m.group(), "")
 
         return "", "", value
 
@@ -127,8 +140,8 @@ class Track:
             name = name.replace(m.group(), "").strip()
 
         # Remove leading index
-        if index:
-            name = re.sub(rf"^0*{index}(?!\W\d)\W+", "", name)
+        if index and (m := cls.INDEX_PREFIX.match(name)) and int(m.group(1)) == index:
+            name = name[m.end() :]
 
         # find the remixer and remove it from the name
         remix = Remix.from_name(name)
@@ -157,7 +170,7 @@ class Track:
     @cached_property
     def duration(self) -> Optional[int]:
         try:
-            h, m, s = map(int, re.findall(r"\d+", self.json_item["duration"]))
+            h, m, s = map(int, self.DIGITS.findall(self.json_item["duration"]))
         except KeyError:
             return None
         else:
@@ -186,7 +199,7 @@ class Track:
         The extra complexity here is to ensure that it does not cut off a title
         that ends with ' - -', like in '(DJ) NICK JERSEY - 202memo - - -'.
         """
-        parts = re.split(r" - (?![^\[(]+[])])", self.full_name)
+        parts = self.TITLE_DELIMITER.split(self.full_name)
         if len(parts) == 1:
             parts = self.full_name.split(" - ")
         title_without_remix = parts[-1]
@@ -1,16 +1,12 @@
 """Module for parsing track names."""
 
-import operator as op
 import re
 from collections import Counter
 from contextlib import suppress
 from dataclasses import dataclass
-from functools import reduce
 from typing import Iterator, List, Optional, Tuple
 
-from ordered_set import OrderedSet
-
-from .helpers import CATNUM_PAT, REMIX
+from .helpers import CATNUM_PAT, HAS_DIGIT, REMIX
 
 
 @dataclass
@@ -58,18 +54,21 @@ class TrackNames:
         or some UTF-8 equivalent of a dash.
 
         This checks every track for the first character (see the regex for exclusions)
-        that splits it. The character that splits the most and at least half of
-        the tracks is the character we need.
+        that splits it. The character that splits more than half of the tracks is
+        the character we need, so we stop as soon as one of them gets there.
 
-        If no such character is found, or if we have just one track, return a dash '-'.
+        If no such character is found, return a dash '-'.
         """
+        counts: Counter[str] = Counter()
+        half = len(names) / 2
+        for name in names:
+            m = cls.DELIMITER_PAT.search(name)
+            delim = m.group(1) if m else "-"
+            counts[delim] += 1
+            if counts[delim] > half:
+                return delim
 
-        def get_delim(string: str) -> str:
-            m = cls.DELIMITER_PAT.search(string)
-            return m.group(1) if m else "-"
-
-        delim, count = Counter(map(get_delim, names)).most_common(1).pop()
-        return delim if (len(names) == 1 or count > len(names) / 2) else "-"
+        return "-"
 
     @classmethod
     def normalize_delimiter(cls, names: List[str]) -> List[str]:
@@ -83,43 +82,64 @@ class TrackNames:
 
         See https://gutterfunkuk.bandcamp.com/album/gutterfunk-all-subject-to-vibes-various-artists-lp
         """
+        if not label:
+            return names
+
         return [
-            (n.replace(label, "").strip(" -") if n.endswith(label) else n)
-            for n in names
+            (n[: -len(label)].strip(" -") if n.endswith(label) else n) for n in names
         ]
 
     @staticmethod
-    def eject_common_catalognum(names: List[str]) -> Tuple[Optional[str], List[str]]:
+    def common_words(names: List[str]) -> List[str]:
+        """Return words found in every name, ordered as in the first one."""
+        first, *rest = map(str.split, names)
+        common = list(dict.fromkeys(first))
+        for words in rest:
+            if not common:
+                break
+            word_set = set(words)
+            common = [w for w in common if w in word_set]
+
+        return common
+
+    @classmethod
+    def eject_common_catalognum(
+        cls, names: List[str]
+    ) -> Tuple[Optional[str], List[str]]:
         """Return catalognum found in every track title.
 
         1. Split each track name into words
         2. Find the list of words that are common to all tracks
         3. Check the *first* and the *last* word for the catalog number
            - If found, return it and remove it from every track name
+
+        Catalog numbers always contain a digit, so words without any are skipped.
         """
         catalognum = None
 
-        names_tokens = map(str.split, names)
-        common_words = reduce(op.and_, [OrderedSet(x) for x in names_tokens])
+        common_words = cls.common_words(names)
         if common_words:
-            matches = (CATNUM_PAT["anywhere"].search(common_words[i]) for i in [0, -1])
+            candidates = (common_words[0], common_words[-1])
+            words = (w for w in candidates if HAS_DIGIT.search(w))
+            matches = map(CATNUM_PAT["anywhere"].search, words)
             with suppress(StopIteration):
                 catalognum, word = next((m.group(1), m.string) for m in matches if m)
                 names = [n.replace(word, "").strip() for n in names]
 
         return catalognum, names
 
-    @staticmethod
-    def parenthesize_remixes(names: List[str]) -> List[str]:
+    @classmethod
+    def parenthesize_remixes(cls, names: List[str]) -> List[str]:
         """Reformat broken remix titles for an album with a single root title.
 
         1. Check whether this release has a single root title
         2. Find remixes that do not have parens around them
         3. Add parens
         """
-        names_tokens = map(str.split, names)
-        common_words = reduce(op.and_, [OrderedSet(x) for x in names_tokens])
-        joined = " ".join(common_words)
+        if len(names) < 2:
+            return names
+
+        joined = " ".join(cls.common_words(names))
         if joined in names:  # it is one of the track names (root title)
             remix_parts = [n.replace(joined, "").lstrip() for n in names]
             return [
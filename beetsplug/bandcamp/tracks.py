@@ -2,11 +2,10 @@
 
 import itertools as it
 from dataclasses import dataclass
-from functools import cached_property
 from itertools import starmap
-from typing import Iterator, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set
 
-from .helpers import Helpers, JSONDict
+from .helpers import Helpers, JSONDict, cached_property
 from .track import Track
 from .track_names import TrackNames
 
@@ -61,9 +60,13 @@ class Tracks:
 
         "Artist1 x Artist2" -> ["Artist1", "Artist2"]
         """
-        return list(dict.fromkeys(it.chain(*(j.artists for j in self.tracks))))
+        artists: Dict[str, None] = {}
+        for track in self.tracks:
+            for artist in track.artists:
+                artists[artist] = None
+        return list(artists)
 
-    @property
+    @cached_property
     def remixers(self) -> List[str]:
         """Return all remix artists."""
         return [
@@ -72,7 +75,7 @@ class Tracks:
             if t.remix and not t.remix.by_other_artist
         ]
 
-    @property
+    @cached_property
     def other_artists(self) -> Set[str]:
         """Return all unique remix and featuring artists."""
         ft = [j.ft for j in self.tracks if j.ft]
@@ -86,7 +89,10 @@ class Tracks:
     @cached_property
     def artistitles(self) -> str:
         """Returned artists and titles joined into one long string."""
-        return " ".join(it.chain(self.raw_names, self.all_artists)).lower()
+        return " ".join([
+            *(t.name.lower() for t in self.tracks),
+            *(a.lower() for a in self.all_artists),
+        ])
 
     def adjust_artists(self, albumartist: str) -> None:
         """Handle some track artist edge cases.
@@ -117,12 +123,11 @@ class Tracks:
                 # this is the only artist that didn't get parsed - relax the rule
                 # and try splitting with '-' without spaces
                 split = t.title.split("-")
-                if len(split) == 1:
+                if len(split) == 1 and (m := TrackNames.DELIMITER_PAT.search(t.title)):
                     # attempt to split by another ' ? ' where '?' may be some utf-8
                     # alternative of a dash
-                    split = [
-                        s for s in TrackNames.DELIMITER_PAT.split(t.title) if len(s) > 1
-                    ]
+                    parts = t.title[: m.start()], t.title[m.end() :]
+                    split = [s for s in parts if len(s) > 1]
                 if len(split) > 1:
                     t.artist, t.title = split
             if not t.artist:
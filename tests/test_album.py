@@ -62,6 +62,12 @@ from beetsplug.bandcamp.album import AlbumName
         ("Album", [], "Album"),
         ("Artist EP", ["Artist"], "Artist EP"),
         ("Artist & Another EP", ["Artist", "Another"], "Artist & Another EP"),
+        # dashes and slashes are stripped from both ends together
+        ("/ - Foo", [], "Foo"),
+        ("Foo -/", [], "Foo"),
+        # words are removed one after another, so 'by' is removed with the artist
+        # once the catalogue number between them is gone
+        ("Night Drive by [CAT001] Artist", ["CAT001", "Artist"], "Night Drive"),
     ],
 )
 def test_clean_name(name, extras, expected):
@@ -34,6 +34,26 @@ def test_genre_variations(keywords, expected, json_meta, beets_config):
     assert Metaguru(json_meta, beets_config).genre == expected
 
 
+@pytest.mark.parametrize(
+    ("always_include", "keywords", "expected"),
+    [
+        (["(?i)CORE$"], ["crazycore"], "crazycore"),
+        (["(x)\\1", "(g)\\1"], ["eggs"], "eggs"),
+    ],
+)
+def test_always_include(always_include, keywords, expected, json_meta, beets_config):
+    beets_config["genre"]["mode"] = "classical"
+    beets_config["genre"]["always_include"] = always_include
+    json_meta.update(keywords=keywords)
+    assert Metaguru(json_meta, beets_config).genre == expected
+
+
+def test_always_include_is_compiled_only_when_needed(json_meta, beets_config):
+    beets_config["genre"]["always_include"] = ["(invalid"]
+    json_meta.update(keywords=[])
+    assert Metaguru(json_meta, beets_config).genre is None
+
+
 TEST_KEYWORDS = {
     "single_word_valid_kw": ["house"],
     "double_word_valid_kw": ["tech house"],
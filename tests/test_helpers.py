@@ -1,6 +1,6 @@
 """Module for the helpers module tests."""
 import pytest
-from beetsplug.bandcamp.helpers import Helpers
+from beetsplug.bandcamp.helpers import DIGI_MEDIA, Helpers
 
 pytestmark = pytest.mark.parsing
 
@@ -91,6 +91,14 @@ def test_bundles_get_excluded(bundle_format, digital_format):
     assert result[0].title == album_name
 
 
+def test_unknown_release_format_defaults_to_digital(vinyl_format):
+    unknown_format = {**vinyl_format, "musicReleaseFormat": "HologramFormat"}
+
+    result = Helpers.get_media_formats([unknown_format])
+
+    assert [m.name for m in result] == [DIGI_MEDIA]
+
+
 @pytest.mark.parametrize(
     ("artists", "expected"),
     [
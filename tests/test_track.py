@@ -41,3 +41,14 @@ def test_parse_catalognum_from_track_name(
 )
 def test_check_digi_only(name, expected_digi_only, expected_name):
     assert Track.clean_digi_name(name) == (expected_name, expected_digi_only)
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Title (ft. Other)", ("Other", "ft. Other", "Title")),
+        ("(with Z) A (with Z) B", ("Z", "with Z", " A  B")),
+    ],
+)
+def test_split_ft(name, expected):
+    assert Track.split_ft(name) == expected
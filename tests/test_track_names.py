@@ -0,0 +1,19 @@
+"""Module for the track_names module tests."""
+import pytest
+from beetsplug.bandcamp.track_names import TrackNames
+
+pytestmark = pytest.mark.parsing
+
+
+@pytest.mark.parametrize(
+    ("name", "label", "expected"),
+    [
+        ("Artist - Title - Label", "Label", "Artist - Title"),
+        ("Artist - Title Label", "Label", "Artist - Title"),
+        ("Label - Title", "Label", "Label - Title"),
+        ("Label Anthem - Label", "Label", "Label Anthem"),
+        ("Artist - Title - ", "", "Artist - Title - "),
+    ],
+)
+def test_remove_label(name, label, expected):
+    assert TrackNames.remove_label([name], label) == [expected]
@@ -127,3 +127,22 @@ def test_parse_track_name(name, expected, json_track, json_meta, console):
     result_track = list(tracks)[0]
     result = dict(zip(fields, attrgetter(*fields)(result_track)))
     assert result == expected, print_result(console, name, expected, result)
+
+
+def test_adjust_artists_splits_on_the_first_utf8_dash(json_meta):
+    json_meta.update(
+        track={
+            "itemListElement": [
+                {"item": {"@id": "1", "name": "Some Artist - Some Title"}},
+                {"item": {"@id": "2", "name": "Artist – Title – Other"}},
+            ]
+        }
+    )
+    tracks = Tracks.from_json(json_meta)
+
+    tracks.adjust_artists("Albumartist")
+
+    assert [(t.artist, t.title) for t in tracks] == [
+        ("Some Artist", "Some Title"),
+        ("Artist", "Title – Other"),
+    ]